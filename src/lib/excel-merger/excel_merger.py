@@ -1,6 +1,8 @@
+from __future__ import annotations
+
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Tuple, Optional, Union
+from typing import List, Dict, Any, Tuple, Optional, Union, Literal, TYPE_CHECKING
 import os
 import re
 import logging
@@ -9,15 +11,31 @@ import hashlib
 from pathlib import Path
 import tempfile
 import traceback
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from openpyxl import load_workbook, Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
 import warnings
 
+# pyarrow, polars, and the Excel engines are deliberately not imported at
+# module level: callers that only validate or checksum files shouldn't pay
+# their import cost, so each is loaded inside the method that needs it.
+# Type checkers still need pyarrow for the pa.Table annotations
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 # Suppress pandas warnings for cleaner output
 warnings.filterwarnings('ignore', category=UserWarning)
 
+# Precompiled patterns for column name standardization
+_RE_NONALNUM = re.compile(r'[^a-zA-Z0-9\s]')
+_RE_COLLAPSE = re.compile(r'[\s_]+')
+
+# Standardized + deduplicated header results keyed by the original column
+# tuple - sheets from templated workbooks usually share identical headers
+_COLUMNS_CACHE: Dict[Tuple, List[str]] = {}
+_COLUMNS_CACHE_MAX = 4096
+
 @dataclass
 class FileMetadata:
     """Metadata for processed Excel files"""
@@ -56,15 +74,20 @@ class ExcelFileMerger:
     MAX_FILES = 20
     VALID_EXTENSIONS = ['.xlsx', '.xls']
     CHUNK_SIZE = 10000  # Process data in chunks to manage memory
+    HASH_CHUNK_SIZE = 1024 * 1024  # Read 1MB at a time when hashing to amortize syscall cost
     
-    def __init__(self, output_dir: str = None):
+    def __init__(self, output_dir: str = None, output_format: Literal['xlsx', 'parquet'] = 'xlsx'):
         """
         Initialize the Excel merger
-        
+
         Args:
             output_dir: Directory to save output files (default: temp directory)
+            output_format: Output file format - 'xlsx' for a formatted workbook,
+                'parquet' for a much smaller and faster columnar file when the
+                consumer doesn't need Excel formatting
         """
         self.output_dir = output_dir or tempfile.gettempdir()
+        self.output_format = output_format
         self.logger = self._setup_logger()
         self.processed_files: List[FileMetadata] = []
         
@@ -84,13 +107,19 @@ class ExcelFileMerger:
         return logger
     
     def _calculate_checksum(self, file_path: str) -> str:
-        """Calculate MD5 checksum of file"""
-        hash_md5 = hashlib.md5()
+        """Calculate SHA-256 checksum of file"""
+        # SHA-256 uses hardware acceleration (SHA-NI) where available,
+        # unlike MD5 which is always computed in software
         try:
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+                if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                    # C-level loop over a large internal buffer - no per-chunk
+                    # interpreter overhead
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+                hash_sha256 = hashlib.sha256()
+                for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b""):
+                    hash_sha256.update(chunk)
+                return hash_sha256.hexdigest()
         except Exception as e:
             self.logger.error(f"Error calculating checksum for {file_path}: {str(e)}")
             return ""
@@ -119,48 +148,52 @@ class ExcelFileMerger:
             errors.append(f"File size ({file_size / 1024 / 1024:.2f}MB) exceeds maximum allowed size ({self.MAX_FILE_SIZE / 1024 / 1024}MB)")
             return False, errors
         
-        # Check if file is a valid Excel file
+        # Check if file is a valid Excel file. Only a cheap structural probe
+        # here - the workbook is parsed exactly once, during extraction, so
+        # validation must not open it a second time
         try:
-            with pd.ExcelFile(file_path, engine='openpyxl' if file_ext == '.xlsx' else 'xlrd') as excel_file:
-                if not excel_file.sheet_names:
-                    errors.append("File contains no sheets")
+            if file_ext == '.xlsx':
+                if not zipfile.is_zipfile(file_path):
+                    errors.append("Invalid Excel file or corrupted: not a zip archive")
                     return False, errors
+                # Reading the zip directory is enough to prove there is a
+                # workbook inside - no XML gets parsed here
+                with zipfile.ZipFile(file_path) as archive:
+                    if 'xl/workbook.xml' not in archive.namelist():
+                        errors.append("Invalid Excel file or corrupted: missing xl/workbook.xml")
+                        return False, errors
+            else:
+                with pd.ExcelFile(file_path, engine='xlrd') as excel_file:
+                    if not excel_file.sheet_names:
+                        errors.append("File contains no sheets")
+                        return False, errors
         except Exception as e:
             errors.append(f"Invalid Excel file or corrupted: {str(e)}")
             return False, errors
         
         return True, errors
     
-    def _standardize_column_name(self, column_name: str) -> str:
+    def _standardize_columns(self, columns: pd.Index) -> pd.Index:
         """
         Standardize column names by removing special characters and converting to lowercase
-        
+
         Args:
-            column_name: Original column name
-            
+            columns: Original column index
+
         Returns:
-            Standardized column name
+            Standardized column index
         """
-        if pd.isna(column_name) or column_name is None:
-            return "unnamed_column"
-        
-        # Convert to string and strip whitespace
-        name = str(column_name).strip()
-        
-        # Remove special characters and replace with underscore
-        name = re.sub(r'[^a-zA-Z0-9\s]', '_', name)
-        
-        # Replace multiple spaces/underscores with single underscore
-        name = re.sub(r'[\s_]+', '_', name)
-        
-        # Convert to lowercase and remove leading/trailing underscores
-        name = name.lower().strip('_')
-        
-        # Ensure name is not empty
-        if not name:
-            name = "unnamed_column"
-            
-        return name
+        # Vectorized pipeline: pandas runs the regexes in one batched pass
+        # instead of one interpreter round-trip per column
+        names = columns.astype('string').fillna('unnamed_column')
+        names = (names.str.strip()
+                      .str.replace(_RE_NONALNUM, '_', regex=True)
+                      .str.replace(_RE_COLLAPSE, '_', regex=True)
+                      .str.lower()
+                      .str.strip('_'))
+
+        # Ensure no name is empty
+        return names.where(names != '', 'unnamed_column')
     
     def _process_dataframe(self, df: pd.DataFrame, source_file: str, sheet_name: str) -> pd.DataFrame:
         """
@@ -174,85 +207,148 @@ class ExcelFileMerger:
         Returns:
             Processed DataFrame
         """
-        # Add metadata columns
-        df = df.copy()
-        df['_source_file'] = source_file
-        df['_source_sheet'] = sheet_name
-        df['_processed_timestamp'] = datetime.now()
-        
-        # Standardize column names
-        new_columns = {}
-        for col in df.columns:
-            if col.startswith('_'):  # Skip metadata columns
-                continue
-            standardized = self._standardize_column_name(col)
-            new_columns[col] = standardized
-        
-        df = df.rename(columns=new_columns)
-        
-        # Handle duplicate column names
-        columns = list(df.columns)
-        seen = set()
-        for i, col in enumerate(columns):
-            if col in seen and not col.startswith('_'):
-                counter = 1
-                new_col = f"{col}_{counter}"
+        # Standardize column names before adding metadata columns so the
+        # metadata names never need to be skipped or re-checked. No copy:
+        # the frame was just read from disk, so nothing else aliases it.
+        # Identical headers across sheets/files hit the cache and skip the
+        # regex pipeline entirely
+        cache_key = tuple(df.columns)
+        columns = _COLUMNS_CACHE.get(cache_key)
+
+        if columns is None:
+            standardized = self._standardize_columns(df.columns)
+
+            # Handle duplicate column names in one amortized O(n) pass: the
+            # first occurrence keeps its name, repeats get _1, _2, ...
+            # suffixes. The seen-set check guards against colliding with
+            # headers that already standardized to a suffixed form (e.g.
+            # 'Name', 'Name 1', 'Name#' -> name, name_1, name_2); the counter
+            # resumes where it left off so each name is probed at most once
+            counts = Counter()
+            seen = set()
+            columns = []
+            for col in standardized:
+                n = counts[col]
+                new_col = col if n == 0 else f"{col}_{n}"
                 while new_col in seen:
-                    counter += 1
-                    new_col = f"{col}_{counter}"
-                columns[i] = new_col
-            seen.add(columns[i])
-        
+                    n += 1
+                    new_col = f"{col}_{n}"
+                counts[col] = n + 1
+                columns.append(new_col)
+                seen.add(new_col)
+
+            if len(_COLUMNS_CACHE) >= _COLUMNS_CACHE_MAX:
+                _COLUMNS_CACHE.clear()
+            _COLUMNS_CACHE[cache_key] = columns
+
         df.columns = columns
-        
+
+        # Add metadata columns. Categoricals cost one small code per row plus
+        # a shared dictionary, instead of one Python string object per row;
+        # pd.concat unions the categories across files automatically
+        df['_source_file'] = pd.Categorical([source_file] * len(df), categories=[source_file])
+        df['_source_sheet'] = pd.Categorical([sheet_name] * len(df), categories=[sheet_name])
+        # datetime64[ns] broadcasts to 8 bytes/row instead of an
+        # object-dtype column of Python datetime instances
+        df['_processed_timestamp'] = np.datetime64(datetime.now(), 'ns')
+
         return df
     
-    def _extract_sheets_from_file(self, file_path: str) -> Tuple[List[pd.DataFrame], FileMetadata]:
+    def _open_excel_file(self, file_path: str) -> pd.ExcelFile:
+        """
+        Open an Excel file with the fastest available engine
+
+        Args:
+            file_path: Path to Excel file
+
+        Returns:
+            Open pd.ExcelFile handle
+        """
+        # calamine (Rust-based, always streaming) parses xlsx/xls several
+        # times faster than openpyxl/xlrd; fall back to the format-specific
+        # engine if calamine is unavailable or rejects the file
+        try:
+            return pd.ExcelFile(file_path, engine='calamine')
+        except Exception as e:
+            self.logger.warning(f"calamine engine failed for {Path(file_path).name}, falling back: {str(e)}")
+            if Path(file_path).suffix.lower() == '.xlsx':
+                return pd.ExcelFile(
+                    file_path, engine='openpyxl',
+                    engine_kwargs={'read_only': True, 'data_only': True, 'keep_links': False}
+                )
+            return pd.ExcelFile(file_path, engine='xlrd')
+
+    def _extract_sheets_from_file(self, file_path: str) -> Tuple[List[pa.Table], FileMetadata]:
         """
         Extract all sheets from an Excel file
-        
+
         Args:
             file_path: Path to Excel file
-            
+
         Returns:
-            Tuple of (list of DataFrames, file metadata)
+            Tuple of (list of Arrow tables, file metadata)
         """
+        import pyarrow as pa
+
         start_time = datetime.now()
         filename = Path(file_path).name
         file_size = os.path.getsize(file_path)
         checksum = self._calculate_checksum(file_path)
         errors = []
         warnings = []
-        dataframes = []
+        tables = []
         total_rows = 0
         
         try:
-            # Determine engine based on file extension
-            engine = 'openpyxl' if file_path.endswith('.xlsx') else 'xlrd'
-            
-            with pd.ExcelFile(file_path, engine=engine) as excel_file:
+            with self._open_excel_file(file_path) as excel_file:
                 sheet_count = len(excel_file.sheet_names)
-                
-                for sheet_name in excel_file.sheet_names:
+
+                # Read every sheet in one call so the shared-string and style
+                # tables are parsed once for the whole workbook instead of
+                # being re-walked per sheet. Arrow-backed dtypes store strings
+                # as contiguous bytes + offsets instead of one Python object
+                # per cell, which the later concat/hash/dedup steps fast-path
+                try:
+                    sheets = pd.read_excel(excel_file, sheet_name=None, header=0,
+                                           dtype_backend='pyarrow')
+                except Exception:
+                    # Fall back to per-sheet reads so one unreadable sheet
+                    # doesn't discard the rest of the workbook
+                    sheets = {}
+                    for sheet_name in excel_file.sheet_names:
+                        try:
+                            sheets[sheet_name] = pd.read_excel(
+                                excel_file, sheet_name=sheet_name, header=0,
+                                dtype_backend='pyarrow'
+                            )
+                        except Exception as e:
+                            error_msg = f"Error processing sheet '{sheet_name}': {str(e)}"
+                            errors.append(error_msg)
+                            self.logger.error(error_msg)
+
+                for sheet_name, df in sheets.items():
                     try:
-                        # Read sheet with error handling
-                        df = pd.read_excel(excel_file, sheet_name=sheet_name, header=0)
-                        
                         # Skip empty sheets
                         if df.empty:
                             warnings.append(f"Sheet '{sheet_name}' is empty and will be skipped")
                             continue
                         
-                        # Remove completely empty rows and columns
-                        df = df.dropna(how='all').dropna(axis=1, how='all')
+                        # Remove completely empty rows and columns: one notna
+                        # mask with numpy any-reductions along both axes,
+                        # instead of two chained dropna passes that each
+                        # allocate a new frame
+                        mask = df.notna().to_numpy()
+                        df = df.iloc[mask.any(axis=1), mask.any(axis=0)]
                         
                         if df.empty:
                             warnings.append(f"Sheet '{sheet_name}' contains no data after cleaning")
                             continue
                         
-                        # Process the DataFrame
+                        # Process the DataFrame and hand it on as an Arrow
+                        # table: tables concatenate by chunk without copying,
+                        # and pickle cheaply across the worker boundary
                         processed_df = self._process_dataframe(df, filename, sheet_name)
-                        dataframes.append(processed_df)
+                        tables.append(pa.Table.from_pandas(processed_df, preserve_index=False))
                         total_rows += len(processed_df)
                         
                         self.logger.info(f"Processed sheet '{sheet_name}' from '{filename}': {len(processed_df)} rows")
@@ -282,34 +378,39 @@ class ExcelFileMerger:
             warnings=warnings
         )
         
-        return dataframes, metadata
-    
-    def _merge_dataframes(self, all_dataframes: List[pd.DataFrame]) -> pd.DataFrame:
+        return tables, metadata
+
+    def _merge_dataframes(self, all_tables: List[pa.Table]) -> pd.DataFrame:
         """
-        Merge all DataFrames into a single consolidated DataFrame
-        
+        Merge all extracted sheet tables into a single consolidated DataFrame
+
         Args:
-            all_dataframes: List of DataFrames to merge
-            
+            all_tables: List of Arrow tables to merge
+
         Returns:
             Consolidated DataFrame
         """
-        if not all_dataframes:
+        import polars as pl
+
+        if not all_tables:
             raise ExcelMergerError("No valid data found to merge")
-        
+
         try:
-            # Concatenate all DataFrames
-            merged_df = pd.concat(all_dataframes, ignore_index=True, sort=False)
-            
-            # Remove duplicate rows (excluding metadata columns)
-            data_columns = [col for col in merged_df.columns if not col.startswith('_')]
-            merged_df = merged_df.drop_duplicates(subset=data_columns, keep='first')
-            
-            # Sort by source file and sheet for better organization
-            merged_df = merged_df.sort_values(['_source_file', '_source_sheet'], na_position='last')
-            merged_df = merged_df.reset_index(drop=True)
-            
-            self.logger.info(f"Successfully merged {len(all_dataframes)} DataFrames into {len(merged_df)} rows")
+            # Polars runs the concat/dedup core multi-threaded with SIMD hash
+            # tables; conversion from Arrow is zero-copy. diagonal_relaxed
+            # unifies disjoint columns and types across sheets the way
+            # permissive Arrow promotion did
+            frames = [pl.from_arrow(table) for table in all_tables]
+            merged = pl.concat(frames, how='diagonal_relaxed')
+
+            # Remove duplicate rows (excluding metadata columns);
+            # maintain_order keeps rows grouped by source file and sheet
+            data_columns = [col for col in merged.columns if not col.startswith('_')]
+            merged = merged.unique(subset=data_columns, keep='first', maintain_order=True)
+
+            merged_df = merged.to_pandas(use_pyarrow_extension_array=True)
+
+            self.logger.info(f"Successfully merged {len(all_tables)} sheet tables into {len(merged_df)} rows")
             
             return merged_df
             
@@ -359,83 +460,151 @@ class ExcelFileMerger:
         
         return pd.DataFrame(metadata_data)
     
+    def _save_merged(self, merged_df: pd.DataFrame, metadata_df: pd.DataFrame, output_path: str) -> None:
+        """
+        Save merged data and metadata in the configured output format
+
+        Args:
+            merged_df: Merged data DataFrame
+            metadata_df: Metadata DataFrame
+            output_path: Output file path
+        """
+        if self.output_format == 'parquet':
+            self._save_to_parquet(merged_df, metadata_df, output_path)
+        else:
+            self._save_to_excel(merged_df, metadata_df, output_path)
+
+    def _save_to_parquet(self, merged_df: pd.DataFrame, metadata_df: pd.DataFrame, output_path: str) -> None:
+        """
+        Save merged data and metadata as Parquet files
+
+        Args:
+            merged_df: Merged data DataFrame
+            metadata_df: Metadata DataFrame (written to a .metadata.parquet sidecar)
+            output_path: Output file path
+        """
+        try:
+            # The merge step hands back dictionary-typed ArrowDtype columns
+            # for _source_file/_source_sheet; to_parquet embeds that dtype
+            # string in the pandas schema metadata and pd.read_parquet cannot
+            # parse it back. Plain categoricals dict-encode identically in
+            # the file and round-trip cleanly
+            source_columns = [col for col in ('_source_file', '_source_sheet')
+                              if col in merged_df.columns]
+            merged_df = merged_df.assign(
+                **{col: merged_df[col].astype('category') for col in source_columns}
+            )
+
+            # Columnar ZSTD output is ~10x smaller and far faster to write
+            # than xlsx; the categorical metadata columns dictionary-encode
+            # for free
+            merged_df.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+
+            metadata_path = f"{os.path.splitext(output_path)[0]}.metadata.parquet"
+            metadata_df.to_parquet(metadata_path, engine='pyarrow', compression='zstd', index=False)
+
+            self.logger.info(f"Successfully saved merged file to: {output_path}")
+
+        except Exception as e:
+            error_msg = f"Error saving Parquet file: {str(e)}"
+            self.logger.error(error_msg)
+            raise ExcelMergerError(error_msg)
+
     def _save_to_excel(self, merged_df: pd.DataFrame, metadata_df: pd.DataFrame, output_path: str) -> None:
         """
         Save merged data and metadata to Excel file with formatting
-        
+
         Args:
             merged_df: Merged data DataFrame
             metadata_df: Metadata DataFrame
             output_path: Output file path
         """
         try:
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+            # constant_memory mode flushes each row to the zip stream as it
+            # is written, so peak memory stays O(columns) instead of
+            # O(rows x columns)
+            with pd.ExcelWriter(
+                output_path,
+                engine='xlsxwriter',
+                engine_kwargs={'options': {
+                    'constant_memory': True,
+                    'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+                }}
+            ) as writer:
+                header_format = writer.book.add_format({
+                    'bold': True,
+                    'font_color': '#FFFFFF',
+                    'bg_color': '#366092',
+                    'border': 1,
+                    'align': 'center',
+                    'valign': 'vcenter'
+                })
+
                 # Write main data
-                merged_df.to_excel(writer, sheet_name='Merged_Data', index=False)
-                
+                self._write_formatted_sheet(writer, merged_df, 'Merged_Data', header_format)
+
                 # Write metadata
-                metadata_df.to_excel(writer, sheet_name='Processing_Metadata', index=False)
-                
-                # Apply formatting
-                workbook = writer.book
-                
-                # Format main data sheet
-                data_sheet = workbook['Merged_Data']
-                self._apply_sheet_formatting(data_sheet, is_data_sheet=True)
-                
-                # Format metadata sheet
-                metadata_sheet = workbook['Processing_Metadata']
-                self._apply_sheet_formatting(metadata_sheet, is_data_sheet=False)
-            
+                self._write_formatted_sheet(writer, metadata_df, 'Processing_Metadata', header_format)
+
             self.logger.info(f"Successfully saved merged file to: {output_path}")
-            
+
         except Exception as e:
             error_msg = f"Error saving Excel file: {str(e)}"
             self.logger.error(error_msg)
             raise ExcelMergerError(error_msg)
-    
-    def _apply_sheet_formatting(self, sheet, is_data_sheet: bool = True) -> None:
+
+    def _write_formatted_sheet(self, writer: pd.ExcelWriter, df: pd.DataFrame,
+                               sheet_name: str, header_format) -> None:
         """
-        Apply formatting to Excel sheet
-        
+        Write a DataFrame to a formatted worksheet
+
         Args:
-            sheet: Openpyxl worksheet object
-            is_data_sheet: Whether this is the main data sheet
+            writer: Open pd.ExcelWriter (xlsxwriter engine)
+            df: DataFrame to write
+            sheet_name: Target sheet name
+            header_format: xlsxwriter format for the header row
         """
-        # Header formatting
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        # Apply header formatting to first row
-        for cell in sheet[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.border = border
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        # Auto-adjust column widths
-        for column in sheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-            sheet.column_dimensions[column_letter].width = adjusted_width
-        
-        # Freeze header row
-        sheet.freeze_panes = 'A2'
+        # constant_memory mode requires cells to be written strictly
+        # top-to-bottom: once a row is flushed, writes to it are silently
+        # discarded. pandas' to_excel emits body cells column-by-column, so
+        # the header and every data row are written here by hand in row order
+        worksheet = writer.book.add_worksheet(sheet_name)
+        writer.sheets[sheet_name] = worksheet
+
+        # Column widths and the freeze pane are sheet metadata, safe to set
+        # before any row is flushed
+        for col_idx, width in enumerate(self._compute_column_widths(df)):
+            worksheet.set_column(col_idx, col_idx, width)
+        worksheet.freeze_panes(1, 0)
+
+        for col_idx, col_name in enumerate(df.columns):
+            worksheet.write(0, col_idx, str(col_name), header_format)
+
+        for row_idx, row in enumerate(df.itertuples(index=False), start=1):
+            worksheet.write_row(row_idx, 0, [None if pd.isna(value) else value for value in row])
+
+    def _compute_column_widths(self, df: pd.DataFrame) -> List[int]:
+        """
+        Compute display widths for each column of a DataFrame
+
+        Args:
+            df: DataFrame about to be written
+
+        Returns:
+            List of column widths, capped at 50 characters
+        """
+        # String lengths still reduce per column in C, but only one column is
+        # materialized as strings at a time - a full-frame cast would spike
+        # peak memory at exactly the point the streaming writer keeps it flat
+        data_widths = []
+        for col in df.columns:
+            max_length = df[col].astype('string').str.len().max()
+            data_widths.append(0 if pd.isna(max_length) else int(max_length))
+
+        data_widths = np.asarray(data_widths, dtype=np.int64)
+        header_widths = np.array([len(str(col)) for col in df.columns], dtype=np.int64)
+        widths = np.minimum(np.maximum(data_widths, header_widths) + 2, 50)  # Cap at 50 characters
+        return widths.tolist()
     
     def merge_excel_files(self, file_paths: List[str]) -> MergeResult:
         """
@@ -477,45 +646,59 @@ class ExcelFileMerger:
             if not valid_files:
                 raise ExcelMergerError("No valid Excel files found")
             
-            # Process each file
-            all_dataframes = []
+            # Process each file. Parsing is CPU-bound pure Python that never
+            # releases the GIL, so files are farmed out to worker processes;
+            # results are consumed in submission order to keep the merged
+            # output grouped by input file
+            all_tables = []
             metadata_list = []
+
+            max_workers = min(len(valid_files), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._extract_sheets_from_file, file_path)
+                    for file_path in valid_files
+                ]
+
+                for file_path, future in zip(valid_files, futures):
+                    try:
+                        tables, metadata = future.result()
+                        all_tables.extend(tables)
+                        metadata_list.append(metadata)
+
+                        # Collect errors and warnings
+                        all_errors.extend(metadata.errors)
+                        all_warnings.extend(metadata.warnings)
+
+                    except ExcelMergerError as e:
+                        # Validation no longer parses the workbook, so a
+                        # corrupt file surfaces here as an extraction failure.
+                        # It only skips itself - the remaining files still
+                        # merge, matching the old validation-phase behavior
+                        all_errors.append(str(e))
+                        continue
+                    except Exception as e:
+                        error_msg = f"Unexpected error processing {Path(file_path).name}: {str(e)}"
+                        all_errors.append(error_msg)
+                        self.logger.error(error_msg)
+                        continue
             
-            for file_path in valid_files:
-                try:
-                    dataframes, metadata = self._extract_sheets_from_file(file_path)
-                    all_dataframes.extend(dataframes)
-                    metadata_list.append(metadata)
-                    
-                    # Collect errors and warnings
-                    all_errors.extend(metadata.errors)
-                    all_warnings.extend(metadata.warnings)
-                    
-                except ExcelMergerError:
-                    # Re-raise ExcelMergerError
-                    raise
-                except Exception as e:
-                    error_msg = f"Unexpected error processing {Path(file_path).name}: {str(e)}"
-                    all_errors.append(error_msg)
-                    self.logger.error(error_msg)
-                    continue
-            
-            if not all_dataframes:
+            if not all_tables:
                 raise ExcelMergerError("No valid data found in any of the provided files")
-            
-            # Merge all DataFrames
-            merged_df = self._merge_dataframes(all_dataframes)
+
+            # Merge all sheet tables
+            merged_df = self._merge_dataframes(all_tables)
             
             # Create metadata sheet
             metadata_df = self._create_metadata_sheet(metadata_list, merged_df)
             
             # Generate output filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"merged_excel_files_{timestamp}.xlsx"
+            output_filename = f"merged_excel_files_{timestamp}.{self.output_format}"
             output_path = os.path.join(self.output_dir, output_filename)
-            
-            # Save to Excel
-            self._save_to_excel(merged_df, metadata_df, output_path)
+
+            # Save in the configured output format
+            self._save_merged(merged_df, metadata_df, output_path)
             
             # Calculate final statistics
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -570,18 +753,20 @@ class ExcelFileMerger:
             )
 
 # Convenience function for direct usage
-def merge_excel_files(file_paths: List[str], output_dir: str = None) -> Dict[str, Any]:
+def merge_excel_files(file_paths: List[str], output_dir: str = None,
+                      output_format: Literal['xlsx', 'parquet'] = 'xlsx') -> Dict[str, Any]:
     """
     Convenience function to merge Excel files
-    
+
     Args:
         file_paths: List of paths to Excel files to merge
         output_dir: Directory to save output file (optional)
-        
+        output_format: Output file format - 'xlsx' (default) or 'parquet'
+
     Returns:
         Dictionary containing merge results
     """
-    merger = ExcelFileMerger(output_dir)
+    merger = ExcelFileMerger(output_dir, output_format=output_format)
     result = merger.merge_excel_files(file_paths)
     
     # Convert result to dictionary for easier JSON serialization